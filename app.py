@@ -1,148 +1,389 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-from scipy import stats
-from datetime import datetime, timedelta
-from github import Github # GitHub 연동 라이브러리
+import numpy as np
+from github import Github, GithubException, UnknownObjectException # GitHub 연동 라이브러리
 import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # 1. 페이지 설정
 st.set_page_config(page_title="V-Taper Tracker", layout="wide")
 st.title("🔥 Power-Building Slope Tracker : GitHub Auto-Save Edition")
 
 # --- [핵심] GitHub 연동 함수 ---
-def get_github_repo():
+DATA_FILE = "data.parquet"   # 타입이 보존되는 Parquet(snappy)로 저장
+LEGACY_CSV_FILE = "data.csv" # Parquet 파일이 아직 없을 때만 읽음 (첫 저장 시 Parquet로 이전)
+
+# 동시 접속 시 GitHub API 한도(시간당 5000회)에 걸려 429/403이 몰리지 않도록 호출 속도 제한
+class TokenBucket:
+    def __init__(self, rate_per_min, capacity):
+        self.rate = rate_per_min / 60 # 초당 채워지는 토큰 수
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, n=1):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                wait = (n - self.tokens) / self.rate
+            time.sleep(wait)
+
+# 모든 세션/스레드가 하나의 버킷을 공유 (분당 80회 ≈ 시간당 4800회, 순간 10회까지 허용)
+@st.cache_resource
+def get_rate_limiter():
+    return TokenBucket(rate_per_min=80, capacity=10)
+
+def github_api(method, *args):
+    get_rate_limiter().acquire()
+    return method(*args)
+
+# 클라이언트와 repo 객체는 모든 세션/리런에서 공유 (매번 인증 + get_repo 호출 방지)
+@st.cache_resource
+def get_github_client():
     token = st.secrets["github"]["token"]
+    return Github(token, per_page=100, retry=3)
+
+@st.cache_resource
+def get_github_repo():
     repo_name = st.secrets["github"]["repo_name"]
-    g = Github(token)
-    return g.get_repo(repo_name)
+    return github_api(get_github_client().get_repo, repo_name)
+
+# 경로별 (ContentFile, 파싱된 df) 보관 — 모든 세션에서 공유
+@st.cache_resource
+def get_contents_cache():
+    return {}
+
+# 마지막으로 알고 있는 GitHub 파일 상태 (sha와 그 sha의 df를 한 쌍으로) — 로드/저장이 함께 갱신
+# 저장 스레드는 세션이 넘겨준 sha 대신 이 값을 기준으로 변경을 적용 (연속 저장도 409 없이 이어짐)
+# 화면도 캐시된 로드 결과 대신 이 값을 사용 (저장 직후 다시 받지 않아도 모든 세션에 바로 반영)
+@st.cache_resource
+def get_latest_file():
+    return {'lock': threading.Lock(), 'sha': None, 'df': None, 'version': 0}
 
+def read_latest_file():
+    latest = get_latest_file()
+    with latest['lock']:
+        return latest['df'], latest['sha']
+
+def set_latest_file(df, sha, if_version=None):
+    # if_version: 로드를 시작할 때 본 version — 그사이 저장이 끝났으면 더 오래된 로드 결과로 덮어쓰지 않음
+    latest = get_latest_file()
+    with latest['lock']:
+        if if_version is not None and latest['version'] != if_version:
+            return
+        latest['sha'], latest['df'] = sha, df
+        latest['version'] += 1
+
+# 리런마다 다시 받지 않음 (GitHub에서 직접 수정한 내용은 최대 60초 뒤 반영)
+@st.cache_data(ttl=60, show_spinner=False)
 def load_data_from_github():
+    repo = get_github_repo()
+    contents_cache = get_contents_cache()
+    version = get_latest_file()['version']
     try:
-        repo = get_github_repo()
-        # data.csv 파일 내용을 가져옴
-        contents = repo.get_contents("data.csv")
-        return pd.read_csv(io.StringIO(contents.decoded_content.decode()))
-    except:
+        if DATA_FILE in contents_cache:
+            contents, df = contents_cache[DATA_FILE]
+            # ETag 조건부 GET: 바뀐 게 없으면 304 (본문 다운로드/파싱/rate limit 소모 없음)
+            if not github_api(contents.update):
+                set_latest_file(df, contents.sha, version)
+                return df, contents.sha
+        else:
+            # data.parquet 파일 내용을 가져옴
+            contents = github_api(repo.get_contents, DATA_FILE)
+        df = prepare_df(pd.read_parquet(io.BytesIO(contents.decoded_content), engine='pyarrow'))
+        contents_cache[DATA_FILE] = (contents, df)
+        set_latest_file(df, contents.sha, version)
+        return df, contents.sha
+    except UnknownObjectException:
+        contents_cache.pop(DATA_FILE, None)
+    
+    try:
+        # 예전 data.csv가 있으면 읽어옴 (sha는 없음 → 첫 저장 시 data.parquet 생성)
+        contents = github_api(repo.get_contents, LEGACY_CSV_FILE)
+        df = pd.read_csv(io.BytesIO(contents.decoded_content), engine='pyarrow')
+        # 숫자 컬럼은 한 번에 float로 변환 (잘못 입력된 값은 NaN)
+        df[['Weight', 'SMM']] = df[['Weight', 'SMM']].apply(pd.to_numeric, errors='coerce')
+    except UnknownObjectException:
         # 파일이 없으면 빈 데이터프레임 생성
-        return pd.DataFrame(columns=['Date', 'Weight', 'SMM'])
+        df = pd.DataFrame(columns=['Date', 'Weight', 'SMM'])
+    df = prepare_df(df)
+    set_latest_file(df, None, version)
+    return df, None
+
+def prepare_df(df):
+    # 날짜는 한 번만 파싱/정렬하고, 회귀용 일(day) 정수(1970-01-01 기준)도 미리 계산
+    df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d', errors='coerce') # ISO 형식 고정 → 빠른 파싱 경로
+    df = df.dropna(subset=['Date'])
+    if not df['Date'].is_monotonic_increasing: # 이미 정렬된 경우(Parquet 로드 등)는 정렬 생략
+        df = df.sort_values('Date')
+    df = df.reset_index(drop=True)
+    df['Date_Num'] = df['Date'].values.astype('datetime64[D]').astype(np.int32)
+    return df
 
-def save_to_github(df):
+# 백그라운드 스레드에서 실행되므로 st.session_state 대신 apply(최신 df → 저장할 df)를 받음
+# 마지막으로 알고 있는 파일 상태에 apply를 적용해 저장하고, 그사이 파일이 바뀌었으면
+# 오래된 df로 덮어쓰지 않고 최신 파일을 다시 받아 이번 변경만 다시 적용
+def save_to_github(apply):
     repo = get_github_repo()
-    csv_content = df.to_csv(index=False)
+    base, sha = read_latest_file()
+    for attempt in range(3):
+        df = apply(base)
+        buf = io.BytesIO()
+        df[['Date', 'Weight', 'SMM']].to_parquet(buf, engine='pyarrow', compression='snappy', index=False)
+        try:
+            if sha:
+                # 알고 있는 sha로 바로 업데이트 (get_contents 왕복 생략)
+                result = github_api(repo.update_file, DATA_FILE, "Updated data from Streamlit", buf.getvalue(), sha)
+            else:
+                # 파일이 없으면 새로 생성 (Create)
+                result = github_api(repo.create_file, DATA_FILE, f"Created {DATA_FILE}", buf.getvalue())
+            break
+        except GithubException as e:
+            # 다른 곳에서 파일이 바뀌었거나(409) 지워졌거나(404) 먼저 생성됨(422) → 아래에서 다시 시도
+            if e.status not in (404, 409, 422) or attempt == 2:
+                raise
+        
+        try:
+            contents = github_api(repo.get_contents, DATA_FILE)
+            sha, base = contents.sha, prepare_df(pd.read_parquet(io.BytesIO(contents.decoded_content), engine='pyarrow'))
+        except UnknownObjectException:
+            sha = None # 지워졌으면 같은 기준 df로 새로 생성
     
-    try:
-        # 기존 파일이 있으면 업데이트 (Update)
-        contents = repo.get_contents("data.csv")
-        repo.update_file("data.csv", "Updated data from Streamlit", csv_content, contents.sha)
-    except:
-        # 파일이 없으면 새로 생성 (Create)
-        repo.create_file("data.csv", "Created data.csv", csv_content)
+    # 저장한 (df, sha)를 바로 공유 → 모든 세션이 다시 받지 않고 새 데이터를 사용 (로드 캐시는 비우지 않음)
+    set_latest_file(df, result['content'].sha)
+    return result['content'].sha
+
+def same_rows(a, b):
+    # 날짜/체중/골격근량 값이 모두 같은지 (dtype 차이는 무시, NaN끼리는 같다고 봄)
+    return (len(a) == len(b)
+            and np.array_equal(a['Date_Num'].to_numpy(), b['Date_Num'].to_numpy())
+            and np.array_equal(a[['Weight', 'SMM']].to_numpy(dtype=np.float64), b[['Weight', 'SMM']].to_numpy(dtype=np.float64), equal_nan=True))
+
+def replace_if_unchanged(latest, base, edited):
+    # 표 전체 저장용 apply: 편집을 시작한 데이터가 아직 최신일 때만 교체 (병합할 방법이 없으므로)
+    if not same_rows(latest, base):
+        raise RuntimeError("다른 곳에서 데이터가 먼저 수정되었습니다. 새로고침 후 다시 수정해 주세요.")
+    return edited
+
+# 저장은 UI를 막지 않도록 백그라운드에서 처리 (1개 스레드 → 저장 순서 보장)
+@st.cache_resource
+def get_save_executor():
+    return ThreadPoolExecutor(max_workers=1)
 
 # 초기 데이터 로드 (이제 GitHub에서 직접 가져옵니다!)
-df = load_data_from_github()
+# 로드는 60초마다 GitHub의 최신 상태를 get_latest_file()에 반영하고, 화면은 그 (df, sha) 쌍을 사용
+# (방금 끝난 저장 결과가 캐시된 로드 결과보다 새로움)
+loaded_df, loaded_sha = load_data_from_github()
+# 로드 캐시는 남아 있는데 파일 상태만 비워진 경우(리소스 캐시 초기화 등) 다시 채움
+if read_latest_file()[0] is None:
+    set_latest_file(loaded_df, loaded_sha)
+df, data_sha = read_latest_file()
+# 이번 실행의 '오늘'은 여기서 한 번만 읽음 (자정 직전 실행에서도 입력 기본값과 분석 창이 같은 날을 봄)
+TODAY = np.datetime64('today', 'D')
+
+# 끝난 백그라운드 저장 결과를 모두 확인 (실패했으면 화면에 먼저 반영한 데이터를 되돌림)
+pending_saves = st.session_state.setdefault('pending_saves', [])
+for future in [f for f in pending_saves if f.done()]:
+    pending_saves.remove(future)
+    try:
+        future.result()
+        st.toast("✅ GitHub에 영구 저장 완료! (앱이 꺼져도 안전합니다)")
+    except Exception as e:
+        st.session_state.pop('df', None)
+        st.error(f"🚨 GitHub 저장 실패: {e}")
+
+# 입력 위젯이 모두 fragment 안에 있어서 전체 리런이 없을 수 있으므로,
+# 저장이 진행 중인 동안만 주기적으로 확인하다가 끝나면 전체 리런으로 결과를 표시
+@st.fragment(run_every="1s")
+def watch_pending_saves():
+    if any(f.done() for f in st.session_state['pending_saves']):
+        st.rerun()
+
+if pending_saves:
+    watch_pending_saves()
+
+# 저장이 끝나기 전까지는 이 세션에서 방금 저장한 데이터를 그대로 사용 (화면에 바로 반영)
+# 저장이 끝나 새 sha가 공유되면 저장 스레드가 실제로 쓴 데이터(충돌 시 다시 적용한 결과)로 바뀜
+if 'df' in st.session_state and st.session_state['df_base_sha'] == data_sha:
+    df = st.session_state['df']
+else:
+    st.session_state.pop('df', None)
+
+def submit_save(saved_df, apply):
+    # 화면에는 바로 반영하고 GitHub 저장은 백그라운드로 (결과는 다음 리런에서 확인)
+    # saved_df는 prepare_df를 거친 (날짜순 정렬 + Date_Num) 상태여야 함
+    # apply는 최신 GitHub 데이터에 같은 변경을 적용하는 함수 (save_to_github 참고)
+    assert saved_df['Date'].is_monotonic_increasing
+    st.session_state['df'] = saved_df
+    st.session_state['df_base_sha'] = data_sha
+    st.session_state['pending_saves'].append(get_save_executor().submit(save_to_github, apply))
+    st.toast("💾 GitHub에 저장 중...")
+
+def upsert_row(df, input_ts, weight, smm):
+    # 이미 날짜순 정렬되어 있으므로 이진 탐색으로 위치만 찾아 교체/삽입 (전체 재정렬/중복 제거 없음)
+    day_num = np.datetime64(input_ts, 'D').astype(np.int32)
+    i = int(np.searchsorted(df['Date_Num'].to_numpy(), day_num))
+    if i < len(df) and df['Date_Num'].iat[i] == day_num:
+        # 같은 날짜가 있으면 덮어쓰기
+        df = df.copy()
+        df.loc[i, ['Weight', 'SMM']] = [weight, smm]
+        return df
+    new_row = pd.DataFrame({'Date': [input_ts], 'Weight': [weight], 'SMM': [smm], 'Date_Num': np.array([day_num], dtype=np.int32)})
+    return pd.concat([df.iloc[:i], new_row, df.iloc[i:]], ignore_index=True)
 
 # 2. 사이드바: 데이터 입력
-with st.sidebar:
+# fragment라서 입력값을 바꿔도 사이드바만 다시 실행됨 (그래프/분석은 그대로)
+@st.fragment
+def sidebar_input(df, today):
     st.header("📝 오늘의 기록")
-    input_date = st.date_input("날짜", datetime.now())
+    input_date = st.date_input("날짜", today.item())
     input_weight = st.number_input("체중 (kg)", min_value=0.0, step=0.1, format="%.1f")
     input_smm = st.number_input("골격근량 (kg)", min_value=0.0, step=0.1, format="%.1f")
     
     if st.button("💾 데이터 영구 저장하기"):
-        with st.spinner('GitHub에 안전하게 저장 중...'):
-            date_str = input_date.strftime("%Y-%m-%d")
-            new_row = pd.DataFrame({'Date': [date_str], 'Weight': [input_weight], 'SMM': [input_smm]})
-            
-            # 중복 날짜 처리 (덮어쓰기)
-            if not df.empty and date_str in df['Date'].values:
-                df = df[df['Date'] != date_str]
-            
-            df = pd.concat([df, new_row], ignore_index=True)
-            
-            # GitHub에 저장!
-            save_to_github(df)
-            
-        st.success("✅ GitHub에 영구 저장 완료! (앱이 꺼져도 안전합니다)")
-        st.cache_data.clear()
-        st.rerun()
+        # 같은 날짜가 있으면 덮어쓰고, 없으면 날짜순 위치에 삽입
+        input_ts = pd.Timestamp(input_date)
+        saved_df = upsert_row(df, input_ts, input_weight, input_smm)
+        
+        # GitHub에 저장! (그사이 다른 곳에서 저장했으면 최신 데이터에 이 행만 다시 반영)
+        submit_save(saved_df, lambda latest: upsert_row(latest, input_ts, input_weight, input_smm))
+        st.rerun() # 저장 후에만 전체 앱 리런
+
+with st.sidebar:
+    sidebar_input(df, TODAY)
 
 # --- 분석 엔진 ---
-def calculate_slope(dataframe, days):
-    if dataframe.empty or 'Date' not in dataframe.columns:
+def fit_slope(x, y):
+    # 최소제곱 기울기 (scipy 없이 벡터 연산) → (기울기, 마지막 체중), 점이 2개 미만이면 None
+    if x.size < 2:
         return None
-        
-    dataframe['Date_Obj'] = pd.to_datetime(dataframe['Date'])
-    cutoff_date = datetime.now() - timedelta(days=days)
-    recent_df = dataframe[dataframe['Date_Obj'] >= cutoff_date].copy()
-    
-    if len(recent_df) < 2:
+    dx = x - x.mean()
+    return (dx * (y - y.mean())).sum() / (dx * dx).sum(), y[-1]
+
+# 월간 성장률(%) 구간 경계와 판정 — searchsorted(side='right') 한 번으로 구간을 찾음
+# (< 0 | 0 ~ 0.5 | 0.5 ~ 1.0 이하 | 1.0 초과 ~ 1.5 이하 | 1.5 초과)
+VERDICT_THRESHOLDS = np.array([0.0, 0.5, np.nextafter(1.0, np.inf), np.nextafter(1.5, np.inf)])
+VERDICTS = [
+    ("warning", "📉 [Cutting] 중"),
+    None,
+    ("success", "💎 [Lean Bulk] 이상적"),
+    None,
+    ("error", "🚨 [Dirty Bulk] 주의"),
+]
+
+def pick_verdict(monthly_gain_percent):
+    # NaN(체중이 비어 있는 행 등)은 searchsorted에서 맨 끝 구간으로 가므로 따로 판정 없음 처리
+    if np.isnan(monthly_gain_percent):
         return None
-    
-    recent_df['Date_Num'] = recent_df['Date_Obj'].map(datetime.toordinal)
-    slope, intercept, r_value, p_value, std_err = stats.linregress(recent_df['Date_Num'], recent_df['Weight'])
+    return VERDICTS[np.searchsorted(VERDICT_THRESHOLDS, monthly_gain_percent, side='right')]
+
+def summarize_fit(slope, current_weight):
+    # 화면에 그릴 문자열과 판정까지 calculate_slopes에서 한 번에 만들어 둠
+    monthly_gain_kg = slope * 30
+    monthly_gain_percent = (monthly_gain_kg / current_weight) * 100
+    verdict = pick_verdict(monthly_gain_percent)
     
     return {
-        "slope": slope,
-        "current_weight": recent_df['Weight'].iloc[-1]
+        "val_daily": f"{slope:.3f} kg/day",
+        "delta_weekly": f"{(slope * 7):.2f} kg/week",
+        "val_jeff": f"{monthly_gain_percent:.2f} % / 30일",
+        "delta_jeff_kg": f"{monthly_gain_kg:.2f} kg / 30일",
+        "verdict": verdict,
     }
 
-def display_analysis(col, title, days, dataframe):
+# 닫힌 형태 회귀라 매번 계산해도 캐시 적중(배열 해시 + 결과 unpickle)보다 빠르므로 캐시하지 않음
+def calculate_slopes(dates, weights, today_num, day_windows=(14, 30)):
+    results = dict.fromkeys(day_windows)
+    # 날짜순 정렬되어 있으므로 모든 기간의 시작 위치를 이진 탐색 한 번으로 구함
+    starts = np.searchsorted(dates, today_num - np.array(day_windows), side='right')
+    
+    for days, start in zip(day_windows, starts):
+        fit = fit_slope(dates[start:], weights[start:])
+        if fit:
+            results[days] = summarize_fit(*fit)
+    return results
+
+EMPTY_PANEL = {"val_daily": "-", "delta_weekly": None, "val_jeff": "-", "delta_jeff_kg": None, "verdict": None}
+
+def display_analysis(col, title, days, panel):
+    # 계산/포맷은 calculate_slopes에서 끝났으므로 여기서는 그리기만 함
     with col:
         st.subheader(f"{title}")
-        res = calculate_slope(dataframe, days)
-        val_daily, delta_weekly, val_jeff, delta_jeff_kg = "-", None, "-", None
+        p = panel or EMPTY_PANEL
         
-        if res:
-            slope, current_weight = res['slope'], res['current_weight']
-            val_daily = f"{slope:.3f} kg/day"
-            delta_weekly = f"{(slope * 7):.2f} kg/week"
-            monthly_gain_kg = slope * 30
-            monthly_gain_percent = (monthly_gain_kg / current_weight) * 100
-            val_jeff = f"{monthly_gain_percent:.2f} % / 30일"
-            delta_jeff_kg = f"{monthly_gain_kg:.2f} kg / 30일"
-
-        st.metric(label=f"변화량 ({days}일 기준)", value=val_daily, delta=delta_weekly)
+        st.metric(label=f"변화량 ({days}일 기준)", value=p['val_daily'], delta=p['delta_weekly'])
         st.write("---")
         st.markdown(f"**📊 Jeff's Score (%/월)**")
-        st.metric(label="월간 예상 성장률", value=val_jeff, delta=delta_jeff_kg)
+        st.metric(label="월간 예상 성장률", value=p['val_jeff'], delta=p['delta_jeff_kg'])
         
-        if res:
-            if monthly_gain_percent > 1.5: st.error("🚨 [Dirty Bulk] 주의")
-            elif 0.5 <= monthly_gain_percent <= 1.0: st.success("💎 [Lean Bulk] 이상적")
-            elif monthly_gain_percent < 0: st.warning("📉 [Cutting] 중")
-        else:
+        if panel is None:
             st.info(f"👉 {days}일 데이터 부족")
+        elif panel['verdict']:
+            level, text = panel['verdict']
+            getattr(st, level)(text)
+
+# --- 그래프 ---
+# 데이터가 바뀌지 않은 리런에서는 Figure를 다시 만들지 않음 (ndarray로 넘겨서 바이트 단위로 해시)
+# cache_data는 적중할 때마다 Figure를 unpickle(= 생성자/검증 재실행)해서 새로 만드는 것보다 느림
+# → 객체를 그대로 돌려주는 cache_resource 사용 (st.plotly_chart는 Figure를 읽기만 함)
+@st.cache_resource(show_spinner=False)
+def build_fig(dates, weights, smms):
+    import plotly.graph_objects as go # 그래프를 그릴 때만 로드 (첫 화면 표시 속도 개선)
+    # 두 trace를 생성자에 한 번에 넘겨서 검증도 한 번만
+    return go.Figure(data=[
+        go.Scatter(x=dates, y=weights, mode='lines+markers', name='체중(kg)', line=dict(color='firebrick')),
+        go.Scatter(x=dates, y=smms, mode='lines+markers', name='근육량(kg)', line=dict(color='royalblue')),
+    ])
+
+# --- 데이터 관리 ---
+# fragment라서 표를 수정해도 이 탭만 다시 실행됨 (그래프/분석은 그대로)
+@st.fragment
+def data_manager(df):
+    st.subheader("🛠️ 데이터 수정 및 삭제")
+    edited_df = st.data_editor(
+        df.iloc[::-1], # 이미 날짜순 정렬되어 있으므로 뒤집기만 (최신순)
+        width="stretch",
+        num_rows="dynamic",
+        column_order=['Date', 'Weight', 'SMM'],
+        column_config={'Date': st.column_config.DateColumn(format="YYYY-MM-DD")},
+        key="csv_editor"
+    )
+    
+    if st.button("💾 수정사항 영구 저장하기", type="primary"):
+        # 표 전체를 저장하므로 그사이 다른 곳에서 바뀌었으면 덮어쓰지 않고 충돌로 알림
+        # 표는 최신순이므로 다시 뒤집어서 넘김 (날짜를 바꾸지 않은 편집이면 prepare_df의 정렬 생략)
+        saved_df = prepare_df(edited_df.iloc[::-1])
+        submit_save(saved_df, lambda latest: replace_if_unchanged(latest, df, saved_df))
+        st.rerun() # 저장 후에만 전체 앱 리런
 
 # 3. 메인 화면
 if not df.empty:
-    tab1, tab2 = st.tabs(["📊 듀얼 분석", "🛠️ 데이터 관리"])
+    # 선택된 탭만 실행 (데이터 관리 탭을 열지 않으면 data_editor를 만들거나 보내지 않음)
+    tab1, tab2 = st.tabs(["📊 듀얼 분석", "🛠️ 데이터 관리"], key="main_tab", on_change="rerun")
     
-    with tab1:
-        plot_df = df.sort_values(by='Date')
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=plot_df['Date'], y=plot_df['Weight'], mode='lines+markers', name='체중(kg)', line=dict(color='firebrick')))
-        fig.add_trace(go.Scatter(x=plot_df['Date'], y=plot_df['SMM'], mode='lines+markers', name='근육량(kg)', line=dict(color='royalblue')))
-        st.plotly_chart(fig, use_container_width=True)
-        st.divider()
-        col1, col2 = st.columns(2)
-        display_analysis(col1, "⏱️ 최근 14일", 14, df)
-        display_analysis(col2, "📅 최근 30일", 30, df)
-
-    with tab2:
-        st.subheader("🛠️ 데이터 수정 및 삭제")
-        edited_df = st.data_editor(
-            df.sort_values(by='Date', ascending=False),
-            use_container_width=True,
-            num_rows="dynamic",
-            key="csv_editor"
-        )
-        
-        if st.button("💾 수정사항 영구 저장하기", type="primary"):
-            with st.spinner('GitHub에 업데이트 중...'):
-                save_to_github(edited_df)
-            st.success("✅ GitHub 파일이 업데이트되었습니다!")
-            st.cache_data.clear()
-            st.rerun()
+    if tab1.open:
+        with tab1:
+            # df는 로드 시 이미 날짜순 정렬됨
+            fig = build_fig(df['Date'].to_numpy(), df['Weight'].to_numpy(), df['SMM'].to_numpy())
+            st.plotly_chart(fig, width="stretch")
+            st.divider()
+            col1, col2 = st.columns(2)
+            # 오늘 날짜를 일(day) 정수로 (Date_Num과 같은 기준)
+            today_num = int(TODAY.astype(np.int64))
+            slopes = calculate_slopes(df['Date_Num'].to_numpy(), df['Weight'].to_numpy(dtype=np.float64), today_num)
+            display_analysis(col1, "⏱️ 최근 14일", 14, slopes[14])
+            display_analysis(col2, "📅 최근 30일", 30, slopes[30])
+
+    if tab2.open:
+        with tab2:
+            data_manager(df)
 else:
     st.info("👈 데이터를 입력하면 GitHub에 영구 저장됩니다!")